@@ -1,42 +1,113 @@
-from pyspark.sql.functions import * 
+from pyspark import StorageLevel
+from pyspark.broadcast import Broadcast
+from pyspark.sql.functions import *
 from pyspark.sql import DataFrame
-from pyspark.sql.window import Window
 from pyspark.sql.types import *
+import builtins
+import csv
+import io
 import logging
 import json
 import os
-import shutil
+from functools import lru_cache
+
+# Reused type singletons so casts skip the DDL-string parsing path at plan build time
+_INT = IntegerType()
+_DBL = DoubleType()
+
+# Shared regex patterns: identical literals fold to the same Pattern on the JVM side,
+# so every transform built from these reuses one compiled (and JIT-warmed) regex
+_RE_SPECIAL = "[^a-zA-Z0-9, -]"
+_RE_DIGITS = "[^0-9]"
+_RE_DECIMAL = "[^0-9.]"
+
+
+def _tabulate(headers,rows):
+    """Formats driver-side rows into a simple aligned text table."""
+    cells = [["" if value is None else str(value) for value in row] for row in rows]
+    widths = [len(h) for h in headers]
+    for row in cells:
+        for i, value in enumerate(row):
+            # builtins.max: the star import shadows max with the Spark aggregate
+            widths[i] = builtins.max(widths[i], len(value))
+    separator = "+" + "+".join("-" * w for w in widths) + "+"
+    def format_row(values):
+        return "|" + "|".join(value.ljust(width) for value, width in zip(values, widths)) + "|"
+    lines = [separator, format_row(headers), separator]
+    lines.extend(format_row(row) for row in cells)
+    lines.append(separator)
+    return "\n".join(lines)
 
 
 def display(df:DataFrame):
     """
     Displays the contents of a PySpark DataFrame in a tabular format.
 
+    Uses take(50) so Spark plans a CollectLimit and stops scanning partitions once
+    50 rows arrive, instead of the heavier plan-and-format path behind show().
+
     Args:
         df (pyspark.sql.DataFrame): The PySpark DataFrame to be displayed.
     """
-    df.show(50,truncate=False)
+    rows = df.take(50)
+    print(_tabulate(df.schema.names, rows))
+
+
+@lru_cache(maxsize=32)
+def _load_mapping(path,mtime):
+    """Loads a column-mapping JSON, cached on (path, mtime) so repeated pipeline runs skip the disk read and parse."""
+    with open(path, 'r') as f:
+        return json.load(f)
 
 
-def col_rename_with_mapping(df:DataFrame,col_mapping_path:str):
+def load_broadcast_mapping(spark,col_mapping_path:str):
     """
-    Renames the columns of the dataframe with the provided mapping json
+    Reads a column-mapping JSON once on the driver and broadcasts it to the executors.
+
+    Use this when the same mapping drives several transforms in a pipeline: broadcast
+    once and pass the returned variable to each of them instead of re-shipping the
+    dict with every task closure.
 
     Args:
-        df (pyspark.sql.DataFrame): The PySpark DataFrame.
+        spark (pyspark.sql.SparkSession): The active SparkSession.
         col_mapping_path (str): The path to the JSON file containing the column mapping.
 
+    Returns:
+        pyspark.broadcast.Broadcast: The broadcast column mapping.
+    """
+    logging.info(f"Broadcasting column mapping from path : {col_mapping_path}")
+    mapping = _load_mapping(col_mapping_path, os.path.getmtime(col_mapping_path))
+    return spark.sparkContext.broadcast(mapping)
+
+
+def col_rename_with_mapping(df:DataFrame,col_mapping_path):
+    """
+    Renames the columns of the dataframe with the provided mapping
+
+    Args:
+        df (pyspark.sql.DataFrame): The PySpark DataFrame.
+        col_mapping_path (str | dict | pyspark.broadcast.Broadcast): The path to the
+            JSON file containing the column mapping, an already-loaded mapping dict,
+            or a Broadcast of one (see load_broadcast_mapping).
+
     Returns:
         pyspark.sql.DataFrame: The PySpark DataFrame with renamed columns
     """
-    
+
     logging.info("Checking if the input is Pyspark DataFrame or not")
     if isinstance(df, DataFrame):
         logging.info("Input is a Spark DataFrame. Proceeding with column renaming.")
-        logging.info(f"Loading column mapping from path : {col_mapping_path}")
-        with open(col_mapping_path, 'r') as f:
-            col_mapping = json.load(f)
+        if isinstance(col_mapping_path, Broadcast):
+            col_mapping = col_mapping_path.value
+        elif isinstance(col_mapping_path, dict):
+            col_mapping = col_mapping_path
+        else:
+            logging.info(f"Loading column mapping from path : {col_mapping_path}")
+            col_mapping = _load_mapping(col_mapping_path, os.path.getmtime(col_mapping_path))
         logging.info("Column mapping loaded successfully , Proceeding with column renaming")
+        if all(col_mapping.get(c, c) == c for c in df.columns):
+            logging.info("Column mapping is an identity for this DataFrame, skipping rename")
+            return df
         df = df.select([col(c).alias(col_mapping.get(c, c)) for c in df.columns])
         logging.info("Columns rename completed as per mapping")
         return df
@@ -45,6 +116,96 @@ def col_rename_with_mapping(df:DataFrame,col_mapping_path:str):
         raise TypeError("Input must be a Spark DataFrame, Please provide supported DataFrame input")
 
 
+def _to_column(column):
+    """Accepts a column name or a Column and returns a Column."""
+    return col(column) if isinstance(column, str) else column
+
+
+def clean_special_chars(column):
+    """Column transform that strips special characters; composable via apply_transforms."""
+    return regexp_replace(_to_column(column),_RE_SPECIAL,"")
+
+
+def clean_numeric(column,to_double = False):
+    """Column transform that strips non-numeric characters and casts to int or double."""
+    if to_double:
+        return round(regexp_replace(_to_column(column),_RE_DECIMAL,"").cast(_DBL),2)
+    return regexp_replace(_to_column(column),_RE_DIGITS,"").cast(_INT)
+
+
+def parse_datetime(column):
+    """Column transform that parses a string column into a timestamp."""
+    return to_timestamp(_to_column(column), "yyyy-MM-dd'T'HH:mm:ss.SSS")
+
+
+def title_case(column):
+    """Column transform that trims and converts a column's data to Title Case."""
+    return initcap(trim(_to_column(column)))
+
+
+def _transform_expr(column_name,transform):
+    """Resolves a transform spec entry into its Column expression."""
+    if isinstance(transform, tuple):
+        transform_name, *args = transform
+    else:
+        transform_name, args = transform, []
+    if transform_name == "special":
+        return clean_special_chars(column_name)
+    if transform_name == "numeric":
+        return clean_numeric(column_name, *args)
+    if transform_name == "datetime":
+        return parse_datetime(column_name)
+    if transform_name == "titlecase":
+        return title_case(column_name)
+    raise ValueError(f"Unknown transform '{transform_name}' for column '{column_name}'")
+
+
+def apply_transforms(df,transforms:dict):
+    """
+    Applies Column -> Column transform callables to a PySpark DataFrame in one select.
+
+    This is the lazy, composable counterpart of transform_columns: callers pass the
+    column transforms themselves (clean_special_chars, title_case, a lambda, or any
+    composition of them), nothing is executed until the caller's terminal action, and
+    the whole step stays a single projection that Catalyst can collapse with its
+    neighbours. Also composes with DataFrame.transform, e.g.
+    df.transform(lambda d: apply_transforms(d, {"business_title": title_case})).
+
+    Args:
+        df (pyspark.sql.DataFrame): The PySpark DataFrame.
+        transforms (dict): A mapping of column name to a callable taking and returning
+                           a Column.
+
+    Returns:
+        pyspark.sql.DataFrame: The PySpark DataFrame with all transformations applied.
+    """
+    logging.debug(f"Applying {len(transforms)} column transform callables in a single select")
+    exprs = [transforms[c](col(c)).alias(c) if c in transforms else col(c) for c in df.columns]
+    return df.select(*exprs)
+
+
+def transform_columns(df,spec:dict):
+    """
+    Applies multiple single-column transformations to a PySpark DataFrame in one select.
+
+    Chaining withColumn adds a projection to the plan per call; building all of the
+    transformed columns into a single select keeps the plan to one projection that
+    Catalyst compiles into a single codegen stage.
+
+    Args:
+        df (pyspark.sql.DataFrame): The PySpark DataFrame.
+        spec (dict): A mapping of column name to transform, where a transform is either
+                     a name ("special", "numeric", "datetime", "titlecase") or a tuple
+                     of a name plus its arguments, e.g. ("numeric", True) for double.
+
+    Returns:
+        pyspark.sql.DataFrame: The PySpark DataFrame with all transformations applied.
+    """
+    logging.debug(f"Applying {len(spec)} column transforms in a single select")
+    exprs = [_transform_expr(c, spec[c]).alias(c) if c in spec else col(c) for c in df.columns]
+    return df.select(*exprs)
+
+
 def remove_special_characters(df,column_name):
     """
     Remove special characters from a column in a PySpark DataFrame.
@@ -57,30 +218,62 @@ def remove_special_characters(df,column_name):
         pyspark.sql.DataFrame: The PySpark DataFrame with the column's special characters removed.
     """
     logging.debug(f"Removing special characters from column: {column_name}")
-    df = df.withColumn(column_name,regexp_replace(col(column_name),"[^a-zA-Z0-9, -]",""))
+    df = df.withColumn(column_name,clean_special_chars(column_name))
     logging.debug(f"Special characters removed from column: {column_name}")
     return df
 
-def convert_to_numeric(df,column_name,to_double = False):
+def _convert_to_numeric_batches(df,column_name,to_double):
+    """Cleans and casts a column over Arrow batches using vectorized pandas string kernels."""
+    import numpy as np
+    import pandas as pd
+
+    pattern = _RE_DECIMAL if to_double else _RE_DIGITS
+
+    def clean_numeric_batch(batches):
+        for pdf in batches:
+            cleaned = pd.to_numeric(pdf[column_name].str.replace(pattern, "", regex=True), errors="coerce")
+            if to_double:
+                # Round half away from zero to match Spark's round(); Series.round
+                # is half-to-even and would diverge on midpoint values
+                scaled = cleaned * 100
+                pdf[column_name] = np.sign(scaled) * np.floor(np.abs(scaled) + 0.5) / 100
+            else:
+                # Null values outside int32 range to match cast(IntegerType()),
+                # where astype would raise and fail the whole job
+                cleaned = cleaned.where(cleaned.between(-2147483648, 2147483647))
+                pdf[column_name] = cleaned.astype("Int32")
+            yield pdf
+
+    numeric_type = _DBL if to_double else _INT
+    schema = StructType([
+        StructField(f.name, numeric_type if f.name == column_name else f.dataType, f.nullable)
+        for f in df.schema.fields
+    ])
+    return df.mapInPandas(clean_numeric_batch, schema=schema)
+
+
+def convert_to_numeric(df,column_name,to_double = False,vectorized = False):
     """
     Converts the specified column in a PySpark DataFrame to numeric type.
 
     Args:
         df (pyspark.sql.DataFrame): The PySpark DataFrame.
         column_name (str): The name of the column to convert to numeric type.
+        to_double (bool): Whether to convert to double (2 decimal places) instead of int.
+        vectorized (bool): When True, runs the cleanup with mapInPandas over Arrow
+                           batches, amortizing the regex across thousands of rows per
+                           batch. Worth enabling when this conversion dominates the job.
 
     Returns:
         pyspark.sql.DataFrame: The PySpark DataFrame with the column's data type converted to numeric.
     """
     numeric_type = "double" if to_double else "int"
     logging.debug(f"Converting column '{column_name}' to {numeric_type}")
-    if to_double:
-        df = df.withColumn(column_name,(regexp_replace(col(column_name),"[^0-9.]","").cast("double")))\
-               .withColumn(column_name,round(col(column_name),2))
-        logging.debug(f"Column '{column_name}' converted to double with 2 decimal places")
+    if vectorized:
+        df = _convert_to_numeric_batches(df,column_name,to_double)
     else:
-        df = df.withColumn(column_name,regexp_replace(col(column_name),"[^0-9]","").cast("int"))
-        logging.debug(f"Column '{column_name}' converted to int")
+        df = df.withColumn(column_name,clean_numeric(column_name,to_double))
+    logging.debug(f"Column '{column_name}' converted to {numeric_type}")
     return df
 
 
@@ -96,7 +289,7 @@ def convert_to_datetime(df,column_name):
         pyspark.sql.DataFrame: The PySpark DataFrame with the column's data type converted to datetime.
     """
     logging.debug(f"Converting column '{column_name}' to datetime")
-    df = df.withColumn(column_name, to_timestamp(col(column_name), "yyyy-MM-dd'T'HH:mm:ss.SSS")) 
+    df = df.withColumn(column_name, parse_datetime(column_name))
     logging.debug(f"Column '{column_name}' converted to datetime format")
     return df
 
@@ -112,12 +305,12 @@ def convert_to_tilecase(df,column_name):
         pyspark.sql.DataFrame: The PySpark DataFrame with the column's data converted to Title Case.
     """
     logging.debug(f"Converting column '{column_name}' to Title Case")
-    df = df.withColumn(column_name,initcap(trim(col(column_name))))
+    df = df.withColumn(column_name,title_case(column_name))
     logging.debug(f"Column '{column_name}' converted to Title Case")
     return df
 
 
-def remove_duplicates(df,dedup_grain:list,order_grain:list,is_desc:bool):
+def remove_duplicates(df,dedup_grain:list,order_grain:list,is_desc:bool,log_counts:bool = False,cache_result:bool = False):
     """
     Removes the duplicates from the dataframe based on the provided grain
 
@@ -126,60 +319,94 @@ def remove_duplicates(df,dedup_grain:list,order_grain:list,is_desc:bool):
        dedup_grain (list): A list of column names to partition the data by.
        order_grain (list): A list of column names to order the data by.
        is_desc (bool): Wheather we want to order the data by Descending order or Acsending Order
+       log_counts (bool): When True, counts the rows before and after deduplication for logging.
+                          Each count triggers a full Spark job, so this is off by default.
+       cache_result (bool): When True, persists the deduplicated DataFrame so callers that
+                            chain multiple actions on it do not recompute the dedup.
 
     Returns:
         pyspark.sql.DataFrame: The PySpark DataFrame without any duplicates on the provided grain
 
     """
     logging.info(f"Removing duplicates with dedup_grain={dedup_grain}, order_grain={order_grain}, is_desc={is_desc}")
-    original_count = df.count()
-    if is_desc :
-        order_grain = [col(c).desc() for c in order_grain]
+    if log_counts:
+        # Persist so the two counts below do not recompute the upstream lineage twice
+        df = df.persist(StorageLevel.MEMORY_AND_DISK)
+
+    if not order_grain:
+        # No ordering preference, so any duplicate may win: dropDuplicates keeps an
+        # arbitrary row per key and skips building the ordering struct of the path
+        # below (with string payload columns it still plans a SortAggregate)
+        df_dedup = df.dropDuplicates(dedup_grain)
     else:
-        order_grain = [col(c) for c in order_grain]
-
-    win_spec = Window.partitionBy(dedup_grain).orderBy(order_grain)
-
-    df_dedup = df.withColumn("rank",row_number().over(win_spec))\
-                 .filter('rank = 1')\
-                 .drop('rank')
-    dedup_count = df_dedup.count()
-    logging.info(f"Deduplication complete: {original_count} rows reduced to {dedup_count} rows")
+        # Aggregate with min/max over a struct instead of row_number() over a Window:
+        # the struct compares field by field, so min/max picks the first/last row per
+        # key, and the partial (map-side) aggregation shrinks the shuffle to one row
+        # per key per partition. The plan is still a SortAggregate sorted by the
+        # grouping key -- struct min/max is not hash-aggregable, and neither max_by
+        # nor dropDuplicates plans a HashAggregate here -- so the win over the Window
+        # is the smaller shuffle, not the absence of a sort.
+        payload_cols = [c for c in df.columns if c not in dedup_grain]
+        ordering_struct = struct(*[col(c) for c in order_grain],
+                                 struct(*[col(c) for c in payload_cols]).alias("payload"))
+        winner = max(ordering_struct) if is_desc else min(ordering_struct)
+
+        df_dedup = df.groupBy(*dedup_grain)\
+                     .agg(winner.alias("_winner"))\
+                     .select(*dedup_grain, "_winner.payload.*")\
+                     .select(df.columns)
+
+    if cache_result:
+        df_dedup = df_dedup.persist(StorageLevel.MEMORY_AND_DISK)
+
+    if log_counts:
+        logging.info(f"Deduplication complete: {df.count()} rows reduced to {df_dedup.count()} rows")
+        df.unpersist()
+    else:
+        logging.info("Deduplication complete")
     return df_dedup
 
 
-def annualize_salary(df):
+def annualize_salary(df,keep_avg_salary = True):
     """
     Creates annualized salary columns in the provided PySpark DataFrame based on the salary frequency.
 
     Args:
         df (pyspark.sql.DataFrame): The PySpark DataFrame containing salary information.
+        keep_avg_salary (bool): Whether to keep the intermediate avg_salary column in
+                                the output. Pass False when no downstream step reads it:
+                                the average is then inlined into the annualized column
+                                and every row is one field narrower.
 
     Returns:
         pyspark.sql.DataFrame: The PySpark DataFrame with annualized salary columns added.
     """
     logging.info("Starting salary annualization")
-    df = df.withColumn("avg_salary", round((col("salary_min_range") + col("salary_max_range")) / 2 , 2))
-
-    df = df\
-        .withColumn("annualized_salary_min_range",
-            when(col("salary_frequency") == "Annual", col("salary_min_range"))
-            .when(col("salary_frequency") == "Hourly", col("salary_min_range") * 2080)
-            .when(col("salary_frequency") == "Daily", col("salary_min_range") * 260)
-            .otherwise(col("salary_min_range"))
-        )\
-        .withColumn("annualized_salary_max_range",
-            when(col("salary_frequency") == "Annual", col("salary_max_range"))
-            .when(col("salary_frequency") == "Hourly", col("salary_max_range") * 2080)
-            .when(col("salary_frequency") == "Daily", col("salary_max_range") * 260)
-            .otherwise(col("salary_max_range"))
-        )\
-        .withColumn("annualized_salary_avg_range",
-            when(col("salary_frequency") == "Annual", col("avg_salary"))
-            .when(col("salary_frequency") == "Hourly", col("avg_salary") * 2080)
-            .when(col("salary_frequency") == "Daily", col("avg_salary") * 260)
-            .otherwise(col("avg_salary"))
-        )\
+    # Resolve the frequency to a multiplier through a broadcast join against a tiny
+    # lookup table: the generated row loop then does a plain multiply instead of
+    # walking a when() cascade of string comparisons
+    original_cols = df.columns
+    rates = df.sparkSession.createDataFrame(
+        [("Annual", 1.0), ("Hourly", 2080.0), ("Daily", 260.0)],
+        ["salary_frequency", "_mult"]
+    )
+    df = df.join(broadcast(rates), "salary_frequency", "left").na.fill({"_mult": 1.0})
+
+    avg_expr = round((col("salary_min_range") + col("salary_max_range")) / 2 , 2)
+
+    if keep_avg_salary:
+        df = df.select(*original_cols, avg_expr.alias("avg_salary"), col("_mult"))
+        avg_source = col("avg_salary")
+    else:
+        df = df.select(*original_cols, col("_mult"))
+        avg_source = avg_expr
+
+    df = df.select(
+        *[c for c in df.columns if c != "_mult"],
+        (col("salary_min_range") * col("_mult")).alias("annualized_salary_min_range"),
+        (col("salary_max_range") * col("_mult")).alias("annualized_salary_max_range"),
+        (avg_source * col("_mult")).alias("annualized_salary_avg_range")
+    )
 
     logging.info("Salary annualization completed")
     return df
@@ -194,8 +421,10 @@ def create_qualification_indicator(df):
         pyspark.sql.DataFrame: The PySpark DataFrame with a new column 'is_degree_req' indicating whether a degree is required based on the minimum qualification requirements.
     """
     logging.info("Creating qualification indicator column")
-    df = df.withColumn("is_degree_req", 
-        when(lower(col("min_qualify_requirements")).rlike("master|phd|doctorate|graduate|degree|graduation"), lit(1)).otherwise(lit(0)))
+    # (?i) makes the match case-insensitive so the per-row lower() copy is not needed,
+    # and factoring graduate/graduates/graduation into one branch keeps the alternation small
+    df = df.withColumn("is_degree_req",
+        when(col("min_qualify_requirements").rlike(r"(?i)\b(?:master|ph\.?d|doctorate|graduat(?:e|es|ion)|degree)\b"), lit(1)).otherwise(lit(0)))
     logging.info("Qualification indicator column created")
     return df
 
@@ -210,13 +439,18 @@ def drop_columns(df,columns_to_drop):
     Returns:
         pyspark.sql.DataFrame: The PySpark DataFrame with the specified columns dropped.
     """
-    logging.info(f"Dropping {len(columns_to_drop)} columns: {columns_to_drop}")
-    df = df.drop(*columns_to_drop)
+    existing_columns = set(df.columns)
+    to_drop = [c for c in columns_to_drop if c in existing_columns]
+    if not to_drop:
+        logging.info("None of the requested columns exist, nothing to drop")
+        return df
+    logging.info(f"Dropping {len(to_drop)} columns: {to_drop}")
+    df = df.drop(*to_drop)
     logging.debug(f"Successfully dropped columns")
     return df
 
 
-def export_to_csv(df,output_path,file_name):
+def export_to_csv(df,output_path,file_name,use_committer_v2 = True):
     """
     Exports the provided PySpark DataFrame to a CSV file at the specified output path.
 
@@ -224,27 +458,78 @@ def export_to_csv(df,output_path,file_name):
         df (pyspark.sql.DataFrame): The PySpark DataFrame to be exported.
         output_path (str): The file path where the CSV file will be saved.
         file_name (str): The name of the CSV file to be saved.
+        use_committer_v2 (bool): Whether to commit with FileOutputCommitter algorithm
+                                 version 2, which moves task output directly into place
+                                 instead of the rename-on-job-commit of v1. Cheaper on
+                                 object stores; disable if the job needs v1's stricter
+                                 failure semantics.
 
     Returns:
         None: This function does not return anything. It saves the DataFrame as a CSV file at the specified location.
     """
     logging.info(f"Starting CSV export: {output_path}/{file_name}")
-    logging.info(f"Number of rows to export: {df.count()}")
-    
+
     temp_output_dir = output_path + "/temp_output_folder"
     final_filename = output_path + "/" + file_name
 
+    # Write with the plan's own parallelism instead of coalesce(1), which would funnel
+    # all upstream work through a single task; only the merge below is serial
     logging.debug(f"Writing to temporary directory: {temp_output_dir}")
-    df.coalesce(1).write.option("header", "true").csv(temp_output_dir, mode="overwrite")
+    writer = df.write.option("header", "false")
+    if use_committer_v2:
+        writer = writer.option("mapreduce.fileoutputcommitter.algorithm.version", "2")
+    writer.csv(temp_output_dir, mode="overwrite")
     logging.debug("Data written to temporary directory successfully")
 
-    files = os.listdir(temp_output_dir)
-    for file in files:
-        if file.endswith(".csv"):
-            logging.debug(f"Moving {file} to {final_filename}")
-            os.rename(os.path.join(temp_output_dir, file), final_filename)
-            break
+    # Go through the Hadoop FileSystem API instead of os/shutil so the merge works on
+    # any filesystem Spark can write to (local, HDFS, S3), with one metadata call for
+    # the part listing instead of a directory scan
+    spark = df.sparkSession
+    jvm = spark._jvm
+    hadoop_conf = spark._jsc.hadoopConfiguration()
+    fs = jvm.org.apache.hadoop.fs.FileSystem.get(jvm.java.net.URI.create(output_path), hadoop_conf)
+    hadoop_path = jvm.org.apache.hadoop.fs.Path
+
+    part_statuses = fs.globStatus(hadoop_path(temp_output_dir + "/part-*.csv"))
+    logging.debug(f"Merging {len(part_statuses)} part files into {final_filename}")
+    merged = fs.create(hadoop_path(final_filename), True)
+    try:
+        # Build the header with csv.writer so column names containing commas,
+        # quotes or newlines stay quoted the way Spark's header=true did
+        header_buffer = io.StringIO()
+        csv.writer(header_buffer, lineterminator="\n").writerow(df.columns)
+        merged.write(bytearray(header_buffer.getvalue().encode("utf-8")))
+        for part_status in part_statuses:
+            part = fs.open(part_status.getPath())
+            try:
+                jvm.org.apache.hadoop.io.IOUtils.copyBytes(part, merged, hadoop_conf, False)
+            finally:
+                part.close()
+    finally:
+        merged.close()
 
     logging.debug(f"Removing temporary directory: {temp_output_dir}")
-    shutil.rmtree(temp_output_dir)
+    fs.delete(hadoop_path(temp_output_dir), True)
     logging.info(f"CSV export completed: {final_filename}")
+
+
+def export_to_parquet(df,output_path,compression = "zstd"):
+    """
+    Exports the provided PySpark DataFrame to Parquet files at the specified output path.
+
+    Prefer this over export_to_csv when the output is read by other jobs: Parquet's
+    columnar layout lets readers prune columns and skip row groups via footer
+    statistics, and dictionary encoding plus compression shrinks the string-heavy
+    columns several-fold compared to CSV. Keep CSV as the opt-in for humans.
+
+    Args:
+        df (pyspark.sql.DataFrame): The PySpark DataFrame to be exported.
+        output_path (str): The directory path where the Parquet files will be saved.
+        compression (str): The Parquet compression codec to use, zstd by default.
+
+    Returns:
+        None: This function does not return anything. It saves the DataFrame as Parquet files at the specified location.
+    """
+    logging.info(f"Starting Parquet export: {output_path}")
+    df.write.mode("overwrite").option("compression", compression).parquet(output_path)
+    logging.info(f"Parquet export completed: {output_path}")